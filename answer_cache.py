@@ -0,0 +1,175 @@
+# LandGPT Phase 1: Answer cache and startup warm-up
+# File: answer_cache.py
+
+import json
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+from typing import Callable, Hashable, List, Optional, Tuple
+
+_PUNCTUATION = re.compile(r"[?!.,;:'\"()\[\]।॥]+")
+
+
+def normalize_question(text: str) -> str:
+    """Cache key for a question: NFC, casefolded, punctuation and extra spaces removed"""
+    text = unicodedata.normalize("NFC", str(text)).casefold()
+    return " ".join(_PUNCTUATION.sub(" ", text).split())
+
+
+def search_key(params: dict) -> Tuple:
+    """
+    Cache key for a set of search_land_records parameters. Only None and ''
+    are dropped, as build_search_query ignores them; 0 (e.g. min_area=0) is a
+    real filter and stays in the key.
+    """
+    return ('search',) + tuple(sorted(
+        (k, str(v)) for k, v in params.items() if v is not None and v != ''
+    ))
+
+
+def create_data_version_table(conn: sqlite3.Connection):
+    """Single-row counter that writers of land records and FAQs bump on every change"""
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS data_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL
+    )
+    ''')
+    conn.execute("INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0)")
+
+
+def bump_data_version(conn: sqlite3.Connection):
+    """Mark cached answers stale; call inside the writing transaction"""
+    conn.execute("UPDATE data_version SET version = version + 1 WHERE id = 1")
+
+
+def data_version(conn: sqlite3.Connection) -> int:
+    """
+    Token that changes whenever land records or FAQs are inserted, updated
+    or deleted. user_queries writes do not bump it, so logging a question
+    does not invalidate the cache.
+    """
+    try:
+        row = conn.execute("SELECT version FROM data_version WHERE id = 1").fetchone()
+    except sqlite3.OperationalError:
+        return 0  # snapshot published before the counter existed; it never changes
+    return row[0] if row else 0
+
+
+class AnswerCache:
+    """LRU of computed answers, each tagged with the data version it was computed at"""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[int, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, version: int):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, version: int, value):
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class CacheWarmer:
+    """
+    Precomputes answers for the most frequent logged questions and searches,
+    then keeps them fresh by re-warming whenever the data version changes.
+    """
+
+    def __init__(self, responder, connect: Callable[[], sqlite3.Connection],
+                 top_n: int = 50, history: int = 10000, log_db_path: Optional[str] = None):
+        self.responder = responder
+        # connect() is only used to compute answers; the query log is always
+        # read from the writable database, since snapshots hold a stale copy
+        self.connect = connect
+        self.log_db_path = log_db_path or responder.log_db_path
+        self.top_n = top_n
+        self.history = history
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._warmed_version: Optional[int] = None
+
+    def top_queries(self) -> Tuple[List[str], List[dict]]:
+        """Most frequent normalized questions and search parameter sets in recent history"""
+        conn = sqlite3.connect(self.log_db_path)
+        try:
+            rows = conn.execute(
+                "SELECT query, query_type FROM user_queries ORDER BY id DESC LIMIT ?", (self.history,)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        questions: Counter = Counter()
+        examples = {}
+        searches: Counter = Counter()
+        search_params = {}
+        for query, query_type in rows:
+            if query_type == 'search':
+                try:
+                    params = json.loads(query)
+                except ValueError:
+                    continue
+                if isinstance(params, dict):
+                    key = search_key(params)
+                    searches[key] += 1
+                    search_params.setdefault(key, params)
+            else:
+                key = normalize_question(query)
+                if key:
+                    questions[key] += 1
+                    examples.setdefault(key, query)
+
+        return ([examples[key] for key, _ in questions.most_common(self.top_n)],
+                [search_params[key] for key, _ in searches.most_common(self.top_n)])
+
+    def warm(self, conn: Optional[sqlite3.Connection] = None) -> int:
+        """Compute and cache answers for the top queries; returns how many were warmed"""
+        conn = conn or self.connect()
+        questions, searches = self.top_queries()
+        for question in questions:
+            self.responder.answer(question, conn=conn, log=False)
+        for params in searches:
+            self.responder.search(conn=conn, log=False, **params)
+        self._warmed_version = data_version(conn)
+        return len(questions) + len(searches)
+
+    def _refresh_loop(self, interval: float):
+        while not self._stop.wait(interval):
+            try:
+                # Reconnect each round so a snapshot reader can swap to a new snapshot
+                conn = self.connect()
+                if data_version(conn) != self._warmed_version:
+                    self.warm(conn)
+            except sqlite3.Error as e:
+                print(f"⚠️ Cache refresh failed: {e}")
+
+    def start(self, interval: float = 30.0):
+        """Warm now, then re-warm in a background thread when the data changes"""
+        warmed = self.warm()
+        print(f"🔥 Warmed answer cache with {warmed} frequent queries")
+        self._thread = threading.Thread(target=self._refresh_loop, args=(interval,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
@@ -0,0 +1,68 @@
+# LandGPT Phase 1: Land area units
+# File: area_units.py
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+# Hectares per bigha. The bigha is not a fixed unit: UP revenue records use the
+# pucca bigha (~2529 m²) in most districts, but eastern districts record a
+# smaller local bigha. Districts not listed use DEFAULT_BIGHA_HECTARE.
+DEFAULT_BIGHA_HECTARE = 0.2529
+
+BIGHA_HECTARE_BY_DISTRICT = {
+    "Agra": 0.2529,
+    "Aligarh": 0.2529,
+    "Mathura": 0.2529,
+    "Meerut": 0.2529,
+    "Bareilly": 0.2529,
+    "Allahabad": 0.2529,
+    "Prayagraj": 0.2529,
+    "Azamgarh": 0.1338,
+    "Ballia": 0.1338,
+    "Gorakhpur": 0.1338,
+    "Varanasi": 0.1338,
+    "Bahraich": 0.1619,
+    "Balrampur": 0.1619,
+}
+
+
+def bigha_to_hectare(district: Optional[str]) -> float:
+    """Hectares in one bigha for a district"""
+    return BIGHA_HECTARE_BY_DISTRICT.get(district, DEFAULT_BIGHA_HECTARE)
+
+
+def area_array(values: Sequence, invalid: float = np.nan) -> np.ndarray:
+    """
+    Float array from raw area values as scraped: None and blank strings are
+    missing (NaN), anything that does not parse as a number becomes `invalid`
+    """
+    result = []
+    for value in values:
+        if value is None or (isinstance(value, str) and not value.strip()):
+            result.append(np.nan)
+            continue
+        try:
+            result.append(float(value))
+        except (TypeError, ValueError):
+            result.append(invalid)
+    return np.array(result, dtype=float)
+
+
+def normalize_areas(districts: Sequence[Optional[str]],
+                    hectares: Sequence[Optional[float]],
+                    bighas: Sequence[Optional[float]]) -> np.ndarray:
+    """
+    Area in hectares for a batch of records: the recorded hectare figure when
+    present, otherwise the bigha figure converted with the district's factor.
+    Missing or unparseable results are NaN.
+    """
+    hectare = area_array(hectares)
+    bigha = area_array(bighas)
+
+    # Look factors up once per distinct district rather than once per row
+    unique, inverse = np.unique(np.array([d or "" for d in districts], dtype=object),
+                                return_inverse=True)
+    factors = np.array([bigha_to_hectare(d or None) for d in unique], dtype=float)[inverse]
+
+    return np.where(np.isnan(hectare), bigha * factors, hectare)
@@ -0,0 +1,217 @@
+# benchmarks.py - Throughput benchmarks for LandGPT ingestion and queries
+# Usage: python benchmarks.py <parser|encoding|validation> [args...]
+
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from khatauni_pipeline import parse_khatauni_batch
+
+
+def load_fixture_pages(fixture_dir: str = "fixtures/khatauni") -> List[str]:
+    """Load saved khatauni pages from the fixture directory"""
+    pages = []
+    for name in sorted(os.listdir(fixture_dir)):
+        if name.endswith(".html"):
+            with open(os.path.join(fixture_dir, name), encoding="utf-8") as f:
+                pages.append(f.read())
+    return pages
+
+
+def benchmark_parser(fixture_dir: str = "fixtures/khatauni", pages_total: int = 5000,
+                     batch_size: int = 25, workers: int = None):
+    """Compare parser backends, serial and on a process pool, over fixture pages"""
+    pages_total, batch_size = int(pages_total), int(batch_size)
+    workers = int(workers) if workers else None
+
+    fixtures = load_fixture_pages(fixture_dir)
+    if not fixtures:
+        print(f"❌ No fixture pages found in {fixture_dir}")
+        return
+
+    pages = (fixtures * (pages_total // len(fixtures) + 1))[:pages_total]
+    batches = [pages[i:i + batch_size] for i in range(0, len(pages), batch_size)]
+
+    print(f"📄 Parsing {len(pages)} pages ({len(fixtures)} fixtures, batches of {batch_size})")
+
+    for parser in ("html.parser", "lxml"):
+        try:
+            parse_khatauni_batch(fixtures[:1], parser)
+        except Exception as e:
+            print(f"   {parser}: unavailable ({e})")
+            continue
+
+        start = time.perf_counter()
+        for batch in batches:
+            parse_khatauni_batch(batch, parser)
+        serial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(parse_khatauni_batch, batches, [parser] * len(batches)))
+        pooled = time.perf_counter() - start
+
+        print(f"   {parser:12s} serial: {len(pages) / serial:8.0f} pages/s   "
+              f"process pool: {len(pages) / pooled:8.0f} pages/s")
+
+
+def synthetic_records(count: int, seed: int = 42) -> List[Dict]:
+    """Generate land records with realistic categorical cardinality"""
+    rng = random.Random(seed)
+    districts = [f"District {i}" for i in range(75)]
+    land_types = ["कृषि योग्य", "आवासीय", "बंजर", "वाणिज्यिक", "चारागाह"]
+    irrigation = ["सिंचित", "असिंचित"]
+    crops = ["गेहूं", "धान", "मक्का", "गन्ना", "सरसों", "बाजरा"]
+
+    records = []
+    for i in range(count):
+        d = rng.randrange(len(districts))
+        t = rng.randrange(6)
+        v = rng.randrange(40)
+        area = round(rng.uniform(0.05, 8.0), 2)
+        records.append({
+            'district': districts[d],
+            'tehsil': f"{districts[d]} तहसील {t}",
+            'village': f"{districts[d]} तहसील {t} ग्राम {v}",
+            'khasra_number': str(i),
+            'khata_number': f"KH{rng.randint(1, 99999):05d}",
+            'owner_name': f"खातेदार {rng.randint(1, count // 3 + 1)}",
+            'father_name': f"पिता {rng.randint(1, count // 3 + 1)}",
+            'area_hectare': area,
+            'area_bigha': round(area * 3.95, 2),
+            'land_type': rng.choice(land_types),
+            'irrigation_status': rng.choice(irrigation),
+            'crop_details': rng.choice(crops),
+            'mutation_date': f"{rng.randint(2000, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            'registry_date': f"{rng.randint(2000, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        })
+    return records
+
+
+def _timed(conn: sqlite3.Connection, sql: str, repeat: int = 5) -> float:
+    """Best-of-N wall time for a query, in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        conn.execute(sql).fetchall()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def benchmark_encoding(rows: int = 200000):
+    """Compare file size and GROUP BY latency of TEXT vs dictionary-encoded categoricals"""
+    from database_setup import DERIVED_COLUMNS, LAND_RECORD_FIELDS, LAND_RECORD_INDEXES, LandRecordDB
+
+    rows = int(rows)
+    records = synthetic_records(rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Pre-encoding layout: every field stored inline
+        column_defs = ", ".join(
+            f"{field} REAL" if field.startswith("area") else f"{field} TEXT"
+            for field in LAND_RECORD_FIELDS
+        )
+        text_path = os.path.join(tmp, "text.db")
+        conn = sqlite3.connect(text_path)
+        conn.execute(f"""
+        CREATE TABLE land_records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            {column_defs},
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(district, tehsil, village, khasra_number)
+        )""")
+        conn.executemany(
+            f"INSERT INTO land_records ({', '.join(LAND_RECORD_FIELDS)}) "
+            f"VALUES ({', '.join('?' * len(LAND_RECORD_FIELDS))})",
+            [tuple(r[f] for f in LAND_RECORD_FIELDS) for r in records]
+        )
+        conn.commit()
+        conn.execute("VACUUM")
+        conn.close()
+
+        encoded_path = os.path.join(tmp, "encoded.db")
+        db = LandRecordDB(encoded_path)
+        db.insert_land_records(records)
+        conn = sqlite3.connect(encoded_path)
+        # Strip the indexes, derived columns and holdings that other features add,
+        # so both files hold the same data and differ only in the encoding
+        for name in LAND_RECORD_INDEXES:
+            conn.execute(f"DROP INDEX {name}")
+        conn.execute("DROP VIEW land_records_view")
+        for column in DERIVED_COLUMNS:
+            conn.execute(f"ALTER TABLE land_records DROP COLUMN {column}")
+        conn.execute("DROP TABLE khata_holdings")
+        conn.execute("DROP TABLE owner_holdings")
+        conn.commit()
+        conn.execute("VACUUM")
+        conn.close()
+
+        text_size = os.path.getsize(text_path)
+        encoded_size = os.path.getsize(encoded_path)
+        print(f"💾 {rows} rows: TEXT {text_size / 1e6:.1f} MB, "
+              f"encoded {encoded_size / 1e6:.1f} MB ({text_size / encoded_size:.2f}x smaller)")
+
+        text_conn = sqlite3.connect(text_path)
+        encoded_conn = sqlite3.connect(encoded_path)
+        for column in ("district", "land_type", "irrigation_status", "village"):
+            text_ms = _timed(text_conn, f"""
+                SELECT {column}, COUNT(*), AVG(area_hectare) FROM land_records GROUP BY {column}""")
+            encoded_ms = _timed(encoded_conn, f"""
+                SELECT l.value, g.n, g.avg_area
+                FROM (SELECT {column}_id AS id, COUNT(*) AS n, AVG(area_hectare) AS avg_area
+                      FROM land_records GROUP BY {column}_id) g
+                JOIN lookup_{column} l ON l.id = g.id""")
+            print(f"   GROUP BY {column:18s} TEXT {text_ms:7.1f} ms   "
+                  f"encoded {encoded_ms:7.1f} ms   ({text_ms / encoded_ms:.2f}x)")
+        text_conn.close()
+        encoded_conn.close()
+
+
+def benchmark_validation(rows: int = 100000, batch_size: int = 5000):
+    """Validation throughput on its own and as overhead on bulk insert"""
+    from database_setup import LandRecordDB
+    from validation import validate_batch
+
+    rows, batch_size = int(rows), int(batch_size)
+    records = synthetic_records(rows)
+    # A few bad rows so the reject path is exercised
+    for record in records[::97]:
+        record['area_hectare'] = -1.0
+    batches = [records[i:i + batch_size] for i in range(0, rows, batch_size)]
+
+    start = time.perf_counter()
+    rejected = sum(len(validate_batch(batch)[1]) for batch in batches)
+    validate_s = time.perf_counter() - start
+    print(f"🔎 validate_batch: {rows / validate_s:9.0f} rows/s ({rejected} rejected)")
+
+    timings = {}
+    for validate in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = LandRecordDB(os.path.join(tmp, "bench.db"))
+            start = time.perf_counter()
+            for batch in batches:
+                db.insert_land_records(batch, validate=validate)
+            timings[validate] = time.perf_counter() - start
+
+    print(f"💾 bulk insert:         {rows / timings[False]:9.0f} rows/s")
+    print(f"💾 validate + insert:   {rows / timings[True]:9.0f} rows/s "
+          f"({timings[True] / timings[False]:.2f}x raw insert time)")
+
+
+BENCHMARKS = {
+    "parser": benchmark_parser,
+    "encoding": benchmark_encoding,
+    "validation": benchmark_validation,
+}
+
+if __name__ == "__main__":
+    name = sys.argv[1] if len(sys.argv) > 1 else "parser"
+    if name not in BENCHMARKS:
+        print(f"❌ Unknown benchmark '{name}'. Choose from: {', '.join(BENCHMARKS)}")
+        sys.exit(1)
+    BENCHMARKS[name](*sys.argv[2:])
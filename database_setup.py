@@ -3,18 +3,66 @@
 
 import sqlite3
 import json
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 import requests
 from bs4 import BeautifulSoup
 import time
 import random
+import threading
+
+from khatauni_pipeline import KhatauniPipeline, parse_khatauni_html, render_khatauni_html
+from snapshot import SNAPSHOT_DIR, publish_snapshot
+from dictionary_encoding import CATEGORICAL_COLUMNS, CategoryDictionary, create_lookup_tables
+from date_parsing import DateLike, parse_portal_date, to_day_number
+from area_units import bigha_to_hectare, normalize_areas
+from query_builder import DATE_COLUMNS, LandRecordQuery
+from validation import validate_batch
+from faq_import import FAQImporter, prepare_faq_table
+from answer_cache import bump_data_version, create_data_version_table
+from holdings import (create_holdings_tables, holdings_tables_exist, normalize_owner,
+                      rebuild_holdings, refresh_holdings)
+
+
+# Record fields as scraped; categorical ones are stored dictionary-encoded
+LAND_RECORD_FIELDS = (
+    'district', 'tehsil', 'village', 'khasra_number', 'khata_number',
+    'owner_name', 'father_name', 'area_hectare', 'area_bigha',
+    'land_type', 'irrigation_status', 'crop_details', 'mutation_date', 'registry_date'
+)
+
+# Columns computed from the record at ingest, with their SQL types
+DERIVED_COLUMNS = {
+    'mutation_day': 'INTEGER',
+    'registry_day': 'INTEGER',
+    'normalized_area_hectare': 'REAL',  # area_hectare, or area_bigha converted per district
+    'owner_key': 'TEXT',  # owner_name normalized for grouping a person's holdings
+}
+
+# Physical land_records columns written on insert
+LAND_RECORD_COLUMNS = tuple(
+    f"{field}_id" if field in CATEGORICAL_COLUMNS else field for field in LAND_RECORD_FIELDS
+) + tuple(DERIVED_COLUMNS)
+
+LAND_RECORD_INDEXES = {
+    'idx_land_records_mutation_day': '(mutation_day, district_id)',
+    'idx_land_records_registry_day': '(registry_day, district_id)',
+    'idx_land_records_district_mutation_day': '(district_id, mutation_day)',
+    'idx_land_records_district_registry_day': '(district_id, registry_day)',
+    'idx_land_records_area': '(normalized_area_hectare)',
+    'idx_land_records_district_area': '(district_id, normalized_area_hectare)',
+    'idx_land_records_khata_number': '(khata_number, district_id)',
+    'idx_land_records_owner': '(owner_key, district_id)',
+}
+
 
 class LandRecordDB:
     """Database manager for land records"""
 
     def __init__(self, db_path: str = "landgpt.db"):
         self.db_path = db_path
+        self.categories = CategoryDictionary()
+        self._local = threading.local()
         self.init_database()
 
     def init_database(self):
@@ -22,29 +70,74 @@ class LandRecordDB:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
+        # Lookup tables for dictionary-encoded columns
+        create_lookup_tables(cursor)
+
+        # Counter the answer cache compares to detect data changes
+        create_data_version_table(conn)
+
+        legacy = self._has_legacy_land_records(cursor)
+        if legacy:
+            cursor.execute("DROP VIEW IF EXISTS land_records_view")
+            cursor.execute("ALTER TABLE land_records RENAME TO land_records_legacy")
+
         # Main land records table
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS land_records (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            district TEXT NOT NULL,
-            tehsil TEXT NOT NULL,
-            village TEXT NOT NULL,
+            district_id INTEGER NOT NULL REFERENCES lookup_district(id),
+            tehsil_id INTEGER NOT NULL REFERENCES lookup_tehsil(id),
+            village_id INTEGER NOT NULL REFERENCES lookup_village(id),
             khasra_number TEXT NOT NULL,
             khata_number TEXT,
             owner_name TEXT,
             father_name TEXT,
             area_hectare REAL,
             area_bigha REAL,
-            land_type TEXT,
-            irrigation_status TEXT,
-            crop_details TEXT,
+            land_type_id INTEGER REFERENCES lookup_land_type(id),
+            irrigation_status_id INTEGER REFERENCES lookup_irrigation_status(id),
+            crop_details_id INTEGER REFERENCES lookup_crop_details(id),
             mutation_date TEXT,
             registry_date TEXT,
+            mutation_day INTEGER,
+            registry_day INTEGER,
+            normalized_area_hectare REAL,
+            owner_key TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(district, tehsil, village, khasra_number)
+            UNIQUE(district_id, tehsil_id, village_id, khasra_number)
         )
         ''')
 
+        # Tables created before a derived column existed get it added and backfilled
+        self._add_derived_columns(conn)
+
+        # Superseded by idx_land_records_khata_number, which also serves khata-only lookups
+        cursor.execute("DROP INDEX IF EXISTS idx_land_records_khata")
+        for name, columns in LAND_RECORD_INDEXES.items():
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON land_records {columns}")
+
+        # Decoded view with the original column names, for ad-hoc SQL
+        cursor.execute("DROP VIEW IF EXISTS land_records_view")
+        cursor.execute('''
+        CREATE VIEW land_records_view AS
+        SELECT lr.id, d.value AS district, t.value AS tehsil, v.value AS village,
+               lr.khasra_number, lr.khata_number, lr.owner_name, lr.father_name,
+               lr.area_hectare, lr.area_bigha, lt.value AS land_type,
+               irr.value AS irrigation_status, c.value AS crop_details,
+               lr.mutation_date, lr.registry_date, lr.mutation_day, lr.registry_day,
+               lr.normalized_area_hectare, lr.owner_key, lr.created_at
+        FROM land_records lr
+        JOIN lookup_district d ON d.id = lr.district_id
+        JOIN lookup_tehsil t ON t.id = lr.tehsil_id
+        JOIN lookup_village v ON v.id = lr.village_id
+        LEFT JOIN lookup_land_type lt ON lt.id = lr.land_type_id
+        LEFT JOIN lookup_irrigation_status irr ON irr.id = lr.irrigation_status_id
+        LEFT JOIN lookup_crop_details c ON c.id = lr.crop_details_id
+        ''')
+
+        if legacy:
+            self._migrate_legacy_land_records(conn)
+
         # Legal FAQs table
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS legal_faqs (
@@ -54,9 +147,12 @@ class LandRecordDB:
             category TEXT,
             tags TEXT,
             language TEXT DEFAULT 'hindi',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            question_hash TEXT,
+            content_hash TEXT
         )
         ''')
+        prepare_faq_table(conn)
 
         # User queries log
         cursor.execute('''
@@ -69,58 +165,325 @@ class LandRecordDB:
         )
         ''')
 
+        # Records rejected by validation, kept for review
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS quarantined_records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            record_json TEXT NOT NULL,
+            reasons TEXT NOT NULL,
+            quarantined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+
+        # Holdings index, maintained on every land record write
+        new_holdings = not holdings_tables_exist(cursor)
+        create_holdings_tables(cursor)
+        if new_holdings:
+            rebuild_holdings(conn)
+
         conn.commit()
+        self.categories.commit()
+        self.categories.refresh(conn)
         conn.close()
         print("✅ Database initialized successfully")
 
-    def insert_land_record(self, record: Dict):
+    @staticmethod
+    def _has_legacy_land_records(cursor: sqlite3.Cursor) -> bool:
+        """Whether land_records still stores categorical columns as TEXT"""
+        columns = [row[1] for row in cursor.execute("PRAGMA table_info(land_records)")]
+        return 'district' in columns
+
+    def _add_derived_columns(self, conn: sqlite3.Connection):
+        """Add any missing derived columns to land_records and compute them for existing rows"""
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(land_records)")}
+        missing = [column for column in DERIVED_COLUMNS if column not in existing]
+        if not missing:
+            return
+
+        for column in missing:
+            conn.execute(f"ALTER TABLE land_records ADD COLUMN {column} {DERIVED_COLUMNS[column]}")
+
+        cursor = conn.execute("SELECT * FROM land_records")
+        columns = [desc[0] for desc in cursor.description]
+        records = [self.categories.decode_row(dict(zip(columns, row)), conn)
+                   for row in cursor.fetchall()]
+        updates = [
+            tuple(derived[column] for column in missing) + (record['id'],)
+            for record, derived in zip(records, self._derive_columns(records))
+        ]
+
+        conn.executemany(
+            f"UPDATE land_records SET {', '.join(f'{column} = ?' for column in missing)} WHERE id = ?",
+            updates
+        )
+        bump_data_version(conn)
+        print(f"🔁 Backfilled {', '.join(missing)} for {len(updates)} land records")
+
+    @staticmethod
+    def _derive_columns(records: List[Dict]) -> List[Dict]:
+        """Values of the derived columns for a batch of decoded records"""
+        if not records:
+            return []
+
+        areas = normalize_areas(
+            [record.get('district') for record in records],
+            [record.get('area_hectare') for record in records],
+            [record.get('area_bigha') for record in records],
+        )
+
+        derived = []
+        for record, area in zip(records, areas.tolist()):
+            values = {
+                'normalized_area_hectare': None if area != area else round(area, 4),
+                'owner_key': normalize_owner(record.get('owner_name')),
+            }
+            for text_column, day_column in DATE_COLUMNS.items():
+                raw = record.get(text_column)
+                values[day_column] = to_day_number(raw)
+                if isinstance(raw, date):
+                    # date/datetime objects (e.g. from pandas) are stored as ISO text
+                    values[text_column] = parse_portal_date(raw).isoformat()
+            derived.append(values)
+        return derived
+
+    def _encode_rows(self, conn: sqlite3.Connection, records: List[Dict]) -> List[Dict]:
+        """Records as stored: categorical ids plus derived columns"""
+        encoded_rows = []
+        for record, derived in zip(records, self._derive_columns(records)):
+            encoded = self.categories.encode_record(conn, record)
+            encoded.update(derived)
+            encoded_rows.append(encoded)
+        return encoded_rows
+
+    def _migrate_legacy_land_records(self, conn: sqlite3.Connection):
+        """Move rows from a pre-encoding land_records table into the encoded one"""
+        cursor = conn.execute(
+            f"SELECT {', '.join(LAND_RECORD_FIELDS)}, created_at FROM land_records_legacy ORDER BY id"
+        )
+        rows = [dict(zip(LAND_RECORD_FIELDS + ('created_at',), row)) for row in cursor.fetchall()]
+
+        columns = LAND_RECORD_COLUMNS + ('created_at',)
+        conn.executemany(f'''
+        INSERT OR REPLACE INTO land_records ({', '.join(columns)})
+        VALUES ({', '.join('?' * len(columns))})
+        ''', [tuple(encoded.get(column) for column in columns)
+              for encoded in self._encode_rows(conn, rows)])
+        conn.execute("DROP TABLE land_records_legacy")
+        bump_data_version(conn)
+        print(f"🔁 Migrated {len(rows)} land records to dictionary-encoded storage")
+
+    def _write_land_records(self, conn: sqlite3.Connection, records: List[Dict]):
+        """Encode and upsert records on an open connection (caller commits)"""
+        encoded_rows = self._encode_rows(conn, records)
+        rows = [tuple(encoded.get(column) for column in LAND_RECORD_COLUMNS)
+                for encoded in encoded_rows]
+
+        # Holdings keys of rows about to be replaced, so their aggregates shrink too
+        khata_keys, owner_keys = set(), set()
+        for encoded in encoded_rows:
+            previous = conn.execute('''
+            SELECT district_id, khata_number, owner_key FROM land_records
+            WHERE district_id = ? AND tehsil_id = ? AND village_id = ? AND khasra_number = ?
+            ''', (encoded['district_id'], encoded['tehsil_id'], encoded['village_id'],
+                  encoded.get('khasra_number'))).fetchone()
+            if previous:
+                khata_keys.add((previous[0], previous[1]))
+                owner_keys.add((previous[2], previous[0]))
+            khata_keys.add((encoded['district_id'], encoded.get('khata_number')))
+            owner_keys.add((encoded['owner_key'], encoded['district_id']))
+
+        conn.executemany(f'''
+        INSERT OR REPLACE INTO land_records ({', '.join(LAND_RECORD_COLUMNS)})
+        VALUES ({', '.join('?' * len(LAND_RECORD_COLUMNS))})
+        ''', rows)
+
+        refresh_holdings(conn, khata_keys, owner_keys)
+        if rows:
+            bump_data_version(conn)
+
+    def _quarantine(self, conn: sqlite3.Connection, rejected: List[Tuple[Dict, List[str]]]):
+        """Store rejected records with their reasons (caller commits)"""
+        conn.executemany(
+            "INSERT INTO quarantined_records (record_json, reasons) VALUES (?, ?)",
+            [(json.dumps(record, ensure_ascii=False, default=str), ",".join(reasons))
+             for record, reasons in rejected]
+        )
+
+    def insert_land_record(self, record: Dict, validate: bool = True):
         """Insert a land record into database"""
+        return self.insert_land_records([record], validate=validate) == 1
+
+    def insert_land_records(self, records: List[Dict], validate: bool = True) -> int:
+        """
+        Insert a batch of land records in a single transaction.
+        With validate=True the batch first goes through validate_batch(); rejected
+        rows are written to quarantined_records instead. Returns the number inserted.
+        """
+        if not records:
+            return 0
+
+        rejected = []
+        if validate:
+            records, rejected = validate_batch(records)
+
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
 
         try:
-            cursor.execute('''
-            INSERT OR REPLACE INTO land_records
-            (district, tehsil, village, khasra_number, khata_number,
-             owner_name, father_name, area_hectare, area_bigha,
-             land_type, irrigation_status, crop_details, mutation_date, registry_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                record.get('district'), record.get('tehsil'), record.get('village'),
-                record.get('khasra_number'), record.get('khata_number'),
-                record.get('owner_name'), record.get('father_name'),
-                record.get('area_hectare'), record.get('area_bigha'),
-                record.get('land_type'), record.get('irrigation_status'),
-                record.get('crop_details'), record.get('mutation_date'),
-                record.get('registry_date')
-            ))
+            self._write_land_records(conn, records)
+            if rejected:
+                self._quarantine(conn, rejected)
             conn.commit()
-            return True
+            self.categories.commit()
+            if rejected:
+                print(f"⚠️ Quarantined {len(rejected)} invalid records")
+            return len(records)
         except Exception as e:
-            print(f"❌ Error inserting record: {e}")
-            return False
+            conn.rollback()
+            self.categories.rollback()
+            print(f"❌ Error inserting batch of {len(records)} records: {e}")
+            return 0
         finally:
             conn.close()
 
-    def search_land_records(self, **kwargs) -> List[Dict]:
-        """Search land records by various criteria"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def publish_snapshot(self, snapshot_dir: str = SNAPSHOT_DIR) -> str:
+        """Publish a read-only snapshot of the database for query processes"""
+        return publish_snapshot(self.db_path, snapshot_dir)
 
-        query = "SELECT * FROM land_records WHERE 1=1"
-        params = []
+    def _reader(self) -> sqlite3.Connection:
+        """
+        Long-lived per-thread connection for queries, so the statement cache
+        built up by LandRecordQuery's stable SQL text survives between calls
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=256)
+            self._local.conn = conn
+        return conn
+
+    def find_land_records(self, query: LandRecordQuery) -> List[Dict]:
+        """Run a structured query and return decoded records"""
+        return query.execute(self.categories, self._reader())
+
+    @staticmethod
+    def build_search_query(min_area: Optional[float] = None, max_area: Optional[float] = None,
+                           largest: Optional[int] = None, **kwargs) -> LandRecordQuery:
+        """LandRecordQuery for search_land_records parameters"""
+        query = LandRecordQuery()
 
         for key, value in kwargs.items():
             if value:
-                query += f" AND {key} LIKE ?"
-                params.append(f"%{value}%")
+                query.contains(key, value)
 
-        cursor.execute(query, params)
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        if min_area is not None or max_area is not None:
+            query.between('normalized_area_hectare', min_area, max_area)
+        if largest:
+            if min_area is None and max_area is None:
+                # Lets the planner walk the area index instead of sorting NULL rows
+                query.not_null('normalized_area_hectare')
+            query.order_by('normalized_area_hectare', descending=True).limit(largest)
 
-        conn.close()
-        return results
+        return query
+
+    def search_land_records(self, min_area: Optional[float] = None, max_area: Optional[float] = None,
+                            largest: Optional[int] = None, **kwargs) -> List[Dict]:
+        """
+        Search land records by various criteria (substring match on each keyword).
+        min_area/max_area bound the normalized area in hectares; largest=N returns
+        the N biggest matching parcels, largest first. Unknown columns raise ValueError.
+        """
+        return self.find_land_records(
+            self.build_search_query(min_area, max_area, largest, **kwargs))
+
+    def largest_parcels(self, n: int = 10, **kwargs) -> List[Dict]:
+        """Top-N parcels by normalized area, optionally filtered like search_land_records"""
+        return self.search_land_records(largest=n, **kwargs)
+
+    def get_holdings(self, owner: Optional[str] = None, khata_number: Optional[str] = None,
+                     district: Optional[str] = None, include_parcels: bool = True) -> Dict:
+        """
+        Full portfolio of an owner or a khata: totals per district from the
+        holdings index, plus the parcels themselves via the owner/khata index.
+        """
+        if bool(owner) == bool(khata_number):
+            raise ValueError("Pass exactly one of owner or khata_number")
+
+        conn = self._reader()
+        district_id = None
+        if district:
+            district_id = self.categories.id_for(conn, 'district', district)
+            if district_id is None:
+                return {'parcel_count': 0, 'total_area_hectare': 0.0, 'by_district': {}, 'parcels': []}
+
+        if owner:
+            key = normalize_owner(owner)
+            summary_sql = "SELECT district_id, parcel_count, total_area_hectare FROM owner_holdings WHERE owner_key = ?"
+            summary_params = [key]
+            parcels = LandRecordQuery().where('owner_key', key)
+        else:
+            key = str(khata_number)
+            summary_sql = "SELECT district_id, parcel_count, total_area_hectare FROM khata_holdings WHERE khata_number = ?"
+            summary_params = [key]
+            parcels = LandRecordQuery().where('khata_number', key)
+
+        if district_id is not None:
+            summary_sql += " AND district_id = ?"
+            summary_params.append(district_id)
+            parcels.where('district', district)
+
+        by_district = {}
+        for row_district_id, count, area in conn.execute(summary_sql, summary_params):
+            by_district[self.categories.decode('district', row_district_id, conn)] = {
+                'parcel_count': count,
+                'total_area_hectare': round(area or 0.0, 4),
+            }
+
+        holdings = {
+            'owner_key' if owner else 'khata_number': key,
+            'parcel_count': sum(d['parcel_count'] for d in by_district.values()),
+            'total_area_hectare': round(sum(d['total_area_hectare'] for d in by_district.values()), 4),
+            'by_district': by_district,
+        }
+        if include_parcels:
+            holdings['parcels'] = self.find_land_records(
+                parcels.order_by('district').order_by('khasra_number'))
+        return holdings
+
+    @staticmethod
+    def _date_range_query(date_column: str, start: DateLike, end: DateLike,
+                          district: Optional[str]) -> LandRecordQuery:
+        """Records with a parsed mutation/registry date within [start, end]"""
+        if date_column not in DATE_COLUMNS:
+            raise ValueError(f"date_column must be one of {', '.join(DATE_COLUMNS)}")
+
+        query = LandRecordQuery()
+        if district:
+            query.where('district', district)
+        return query.not_null(DATE_COLUMNS[date_column]).between(date_column, start, end)
+
+    def records_in_date_range(self, date_column: str, start: DateLike = None, end: DateLike = None,
+                              district: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Records whose mutation_date or registry_date falls within [start, end], newest first"""
+        query = self._date_range_query(date_column, start, end, district)
+        return self.find_land_records(query.order_by(date_column, descending=True).limit(limit))
+
+    def count_in_date_range(self, date_column: str, start: DateLike = None, end: DateLike = None,
+                            district: Optional[str] = None) -> int:
+        """Number of records in a date range; answered from the index alone"""
+        query = self._date_range_query(date_column, start, end, district)
+        return query.count(self.categories, self._reader())
+
+    def activity_by_district(self, date_column: str, start: DateLike = None,
+                             end: DateLike = None) -> Dict[str, int]:
+        """Per-district record counts in a date range, read from the (district_id, day) index"""
+        query = self._date_range_query(date_column, start, end, None)
+        return query.count(self.categories, self._reader(), by='district')
+
+    def recent_mutations(self, days: int = 30, district: Optional[str] = None,
+                         today: Optional[date] = None) -> List[Dict]:
+        """Mutations recorded in the last `days` days"""
+        today = today or date.today()
+        return self.records_in_date_range('mutation_date', today - timedelta(days=days), today,
+                                          district=district)
 
 
 class BhulekhScraper:
@@ -157,10 +520,10 @@ class BhulekhScraper:
         # Sample villages (would be scraped from actual site)
         return ["Sample Village 1", "Sample Village 2", "Sample Village 3"]
 
-    def scrape_khatauni(self, district: str, tehsil: str, village: str,
-                       search_type: str = "khasra", search_value: str = "1") -> Dict:
+    def fetch_khatauni_html(self, district: str, tehsil: str, village: str,
+                            search_type: str = "khasra", search_value: str = "1") -> str:
         """
-        Scrape khatauni data from Bhulekh portal
+        Fetch the raw khatauni page from Bhulekh portal
         This is a mock implementation - actual implementation would
         interact with the real website
         """
@@ -169,6 +532,7 @@ class BhulekhScraper:
         time.sleep(random.uniform(1, 3))
 
         # Generate mock data for demonstration
+        area_hectare = round(random.uniform(0.5, 5.0), 2)
         mock_record = {
             'district': district,
             'tehsil': tehsil,
@@ -177,8 +541,8 @@ class BhulekhScraper:
             'khata_number': f"KH{random.randint(100, 999)}",
             'owner_name': "Sample Owner Name",
             'father_name': "Sample Father Name",
-            'area_hectare': round(random.uniform(0.5, 5.0), 2),
-            'area_bigha': round(random.uniform(1.0, 12.0), 2),
+            'area_hectare': area_hectare,
+            'area_bigha': round(area_hectare / bigha_to_hectare(district), 2),
             'land_type': random.choice(["कृषि योग्य", "आवासीय", "बंजर"]),
             'irrigation_status': random.choice(["सिंचित", "असिंचित"]),
             'crop_details': random.choice(["गेहूं", "धान", "मक्का", "गन्ना"]),
@@ -186,15 +550,22 @@ class BhulekhScraper:
             'registry_date': "2022-12-10"
         }
 
-        return mock_record
+        return render_khatauni_html(mock_record)
+
+    def scrape_khatauni(self, district: str, tehsil: str, village: str,
+                       search_type: str = "khasra", search_value: str = "1") -> Dict:
+        """Fetch and parse a single khatauni page"""
+        html = self.fetch_khatauni_html(district, tehsil, village, search_type, search_value)
+        return parse_khatauni_html(html)
 
-    def bulk_scrape(self, districts: List[str], max_records_per_district: int = 10):
-        """Bulk scrape data for multiple districts"""
+    def bulk_scrape(self, districts: List[str], max_records_per_district: int = 10,
+                    fetch_workers: int = 4, parse_workers: Optional[int] = None):
+        """Bulk scrape data for multiple districts through the fetch/parse pipeline"""
         db = LandRecordDB()
-        total_scraped = 0
+        targets = []
 
         for district in districts:
-            print(f"🔄 Scraping {district}...")
+            print(f"🔄 Queueing {district}...")
             tehsils = self.get_tehsils(district)
 
             for tehsil in tehsils[:2]:  # Limit to 2 tehsils per district
@@ -202,17 +573,17 @@ class BhulekhScraper:
 
                 for village in villages[:2]:  # Limit to 2 villages per tehsil
                     for khasra_num in range(1, min(max_records_per_district//4 + 1, 6)):
-                        try:
-                            record = self.scrape_khatauni(district, tehsil, village,
-                                                        "khasra", str(khasra_num))
-                            if db.insert_land_record(record):
-                                total_scraped += 1
-                                print(f"  ✅ Scraped Khasra {khasra_num} from {village}")
-                        except Exception as e:
-                            print(f"  ❌ Error scraping {district}/{tehsil}/{village}: {e}")
+                        targets.append((district, tehsil, village, "khasra", str(khasra_num)))
+
+        pipeline = KhatauniPipeline(self, db, fetch_workers=fetch_workers,
+                                    parse_workers=parse_workers)
+        total_scraped = pipeline.run(targets)
 
         print(f"🎉 Total records scraped: {total_scraped}")
 
+        if total_scraped:
+            db.publish_snapshot()
+
 
 class LegalFAQLoader:
     """Load legal FAQs related to land records"""
@@ -266,22 +637,20 @@ class LegalFAQLoader:
             }
         ]
 
-        for faq in sample_faqs:
-            self.insert_faq(faq)
+        counts = FAQImporter(self.db.db_path).import_faqs(sample_faqs)
+        print(f"   {counts['added']} added, {counts['updated']} updated, "
+              f"{counts['unchanged']} unchanged")
 
     def insert_faq(self, faq: Dict):
-        """Insert FAQ into database"""
-        conn = sqlite3.connect(self.db.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-        INSERT INTO legal_faqs (question, answer, category, tags, language)
-        VALUES (?, ?, ?, ?, ?)
-        ''', (faq['question'], faq['answer'], faq['category'],
-              faq['tags'], faq['language']))
-
-        conn.commit()
-        conn.close()
+        """Insert or update a single FAQ (idempotent)"""
+        FAQImporter(self.db.db_path).import_faqs([faq])
+
+    def import_faq_file(self, path: str) -> Dict[str, int]:
+        """Bulk import a .jsonl or .csv FAQ corpus, publishing a snapshot if anything changed"""
+        counts = FAQImporter(self.db.db_path).import_file(path)
+        if counts['added'] + counts['updated']:
+            self.db.publish_snapshot()
+        return counts
 
 
 # Main execution
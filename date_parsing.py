@@ -0,0 +1,90 @@
+# LandGPT Phase 1: Portal date parsing
+# File: date_parsing.py
+
+import re
+from datetime import date, datetime, timedelta
+from typing import Optional, Union
+
+EPOCH = date(1970, 1, 1)
+
+# Devanagari digits appear in dates on Hindi khatauni pages
+DEVANAGARI_DIGITS = str.maketrans("०१२३४५६७८९", "0123456789")
+
+MONTHS = {
+    # Hindi
+    "जनवरी": 1, "फरवरी": 2, "फ़रवरी": 2, "मार्च": 3, "अप्रैल": 4, "मई": 5, "जून": 6,
+    "जुलाई": 7, "अगस्त": 8, "सितंबर": 9, "सितम्बर": 9, "अक्टूबर": 10, "अक्तूबर": 10,
+    "नवंबर": 11, "नवम्बर": 11, "दिसंबर": 12, "दिसम्बर": 12,
+    # English
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+_ISO = re.compile(r"^(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})$")
+_DMY = re.compile(r"^(\d{1,2})[-/.](\d{1,2})[-/.](\d{2}|\d{4})$")
+_NAMED = re.compile(r"^(\d{1,2})\s*[-/ ]\s*([^\d\s/,.-]+)\.?\s*[-/ ,]\s*(\d{4})$")
+
+DateLike = Union[date, str, int, None]
+
+
+def _year(value: str) -> int:
+    year = int(value)
+    if len(value) == 2:
+        # Two-digit years on older entries: 00-49 -> 2000s, 50-99 -> 1900s
+        year += 2000 if year < 50 else 1900
+    return year
+
+
+def parse_portal_date(text) -> Optional[date]:
+    """
+    Parse a date as written on the portal: YYYY-MM-DD, DD/MM/YYYY (also - and .
+    separators), Devanagari digits, and Hindi or English month names
+    ("15 जनवरी 2023", "15-Jan-2023"). Returns None for blank or unparseable input.
+    """
+    if text is None:
+        return None
+    # datetime subclasses date, so it must be narrowed before the date check
+    if isinstance(text, datetime):
+        return text.date()
+    if isinstance(text, date):
+        return text
+
+    value = str(text).strip().translate(DEVANAGARI_DIGITS)
+    if not value:
+        return None
+    # Drop a trailing time component ("2023-01-15 00:00:00")
+    value = re.sub(r"\s+\d{1,2}:\d{2}(:\d{2})?$", "", value)
+
+    try:
+        match = _ISO.match(value)
+        if match:
+            return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+
+        match = _DMY.match(value)
+        if match:
+            return date(_year(match.group(3)), int(match.group(2)), int(match.group(1)))
+
+        match = _NAMED.match(value)
+        if match:
+            name = match.group(2).strip().lower()
+            month = MONTHS.get(name) or MONTHS.get(name[:3])
+            if month:
+                return date(int(match.group(3)), month, int(match.group(1)))
+    except ValueError:
+        # Matched the shape but not a real calendar date (e.g. 31/02/2023)
+        return None
+
+    return None
+
+
+def to_day_number(value: DateLike) -> Optional[int]:
+    """Days since 1970-01-01 for a date or portal date string"""
+    if isinstance(value, int):
+        return value
+    parsed = parse_portal_date(value)
+    return (parsed - EPOCH).days if parsed else None
+
+
+def from_day_number(day: Optional[int]) -> Optional[date]:
+    """Inverse of to_day_number"""
+    return EPOCH + timedelta(days=day) if day is not None else None
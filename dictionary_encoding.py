@@ -0,0 +1,140 @@
+# LandGPT Phase 1: Dictionary encoding for categorical columns
+# File: dictionary_encoding.py
+
+import sqlite3
+from typing import Dict, List, Optional
+
+# Columns stored in land_records as <column>_id referencing lookup_<column>
+CATEGORICAL_COLUMNS = (
+    'district', 'tehsil', 'village', 'land_type', 'irrigation_status', 'crop_details'
+)
+
+
+def lookup_table(column: str) -> str:
+    """Name of the lookup table for a categorical column"""
+    if column not in CATEGORICAL_COLUMNS:
+        raise ValueError(f"{column} is not a dictionary-encoded column")
+    return f"lookup_{column}"
+
+
+def create_lookup_tables(cursor: sqlite3.Cursor):
+    """Create the lookup tables backing the categorical columns"""
+    for column in CATEGORICAL_COLUMNS:
+        cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS {lookup_table(column)} (
+            id INTEGER PRIMARY KEY,
+            value TEXT NOT NULL UNIQUE
+        )
+        ''')
+
+
+class CategoryDictionary:
+    """
+    In-process bidirectional cache of the lookup tables.
+    Ids are never reused or deleted, so cached entries stay valid; values
+    added by other writers are picked up incrementally on a cache miss.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, Dict[str, int]] = {column: {} for column in CATEGORICAL_COLUMNS}
+        self._values: Dict[str, Dict[int, str]] = {column: {} for column in CATEGORICAL_COLUMNS}
+        # Highest id read from each lookup table by refresh()
+        self._loaded_upto: Dict[str, int] = {column: 0 for column in CATEGORICAL_COLUMNS}
+        # Entries inserted in the writer's open transaction, dropped on rollback
+        self._pending: List[tuple] = []
+
+    def refresh(self, conn: sqlite3.Connection, column: Optional[str] = None):
+        """Load lookup rows added since the last refresh"""
+        for col in ([column] if column else CATEGORICAL_COLUMNS):
+            rows = conn.execute(
+                f"SELECT id, value FROM {lookup_table(col)} WHERE id > ? ORDER BY id",
+                (self._loaded_upto[col],)
+            ).fetchall()
+            for id_, value in rows:
+                self._ids[col][value] = id_
+                self._values[col][id_] = value
+            if rows:
+                self._loaded_upto[col] = rows[-1][0]
+
+    def encode(self, conn: sqlite3.Connection, column: str, value) -> Optional[int]:
+        """Id for a value, inserting it into the lookup table if it is new"""
+        if value is None or value == '':
+            return None
+        value = str(value)
+
+        id_ = self._ids[column].get(value)
+        if id_ is not None:
+            return id_
+
+        table = lookup_table(column)
+        cursor = conn.execute(f"INSERT OR IGNORE INTO {table} (value) VALUES (?)", (value,))
+        if cursor.rowcount:
+            id_ = cursor.lastrowid
+            self._pending.append((column, value, id_))
+        else:
+            id_ = conn.execute(f"SELECT id FROM {table} WHERE value = ?", (value,)).fetchone()[0]
+
+        self._ids[column][value] = id_
+        self._values[column][id_] = value
+        return id_
+
+    def id_for(self, conn: sqlite3.Connection, column: str, value) -> Optional[int]:
+        """Id for an exact value without inserting it; None if the value is unknown"""
+        if value is None or value == '':
+            return None
+        id_ = self._ids[column].get(str(value))
+        if id_ is None:
+            self.refresh(conn, column)
+            id_ = self._ids[column].get(str(value))
+        return id_
+
+    def decode(self, column: str, id_: Optional[int], conn: Optional[sqlite3.Connection] = None) -> Optional[str]:
+        """Value for an id; refreshes from the database on a miss when a connection is given"""
+        if id_ is None:
+            return None
+        value = self._values[column].get(id_)
+        if value is None and conn is not None:
+            self.refresh(conn, column)
+            value = self._values[column].get(id_)
+        return value
+
+    def matching_ids(self, conn: sqlite3.Connection, column: str, substring: str) -> List[int]:
+        """Ids whose value contains substring (case-insensitive, like SQL LIKE '%x%')"""
+        self.refresh(conn, column)
+        needle = str(substring).lower()
+        return [id_ for value, id_ in self._ids[column].items() if needle in value.lower()]
+
+    def prefix_ids(self, conn: sqlite3.Connection, column: str, prefix: str) -> List[int]:
+        """Ids whose value starts with prefix (case-sensitive)"""
+        self.refresh(conn, column)
+        prefix = str(prefix)
+        return [id_ for value, id_ in self._ids[column].items() if value.startswith(prefix)]
+
+    def encode_record(self, conn: sqlite3.Connection, record: Dict) -> Dict:
+        """Copy of record with categorical values replaced by <column>_id keys"""
+        encoded = {k: v for k, v in record.items() if k not in CATEGORICAL_COLUMNS}
+        for column in CATEGORICAL_COLUMNS:
+            encoded[f"{column}_id"] = self.encode(conn, column, record.get(column))
+        return encoded
+
+    def decode_row(self, row: Dict, conn: Optional[sqlite3.Connection] = None) -> Dict:
+        """Replace <column>_id keys in a row with decoded <column> values"""
+        decoded = {}
+        for key, value in row.items():
+            column = key[:-3] if key.endswith('_id') else None
+            if column in CATEGORICAL_COLUMNS:
+                decoded[column] = self.decode(column, value, conn)
+            else:
+                decoded[key] = value
+        return decoded
+
+    def commit(self):
+        """Mark values inserted in the current transaction as durable"""
+        self._pending.clear()
+
+    def rollback(self):
+        """Forget values whose lookup rows were rolled back"""
+        for column, value, id_ in self._pending:
+            self._ids[column].pop(value, None)
+            self._values[column].pop(id_, None)
+        self._pending.clear()
@@ -0,0 +1,231 @@
+# LandGPT Phase 1: Bulk FAQ import
+# File: faq_import.py
+# Usage: python faq_import.py faqs.jsonl [more.csv ...]
+
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import unicodedata
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from answer_cache import bump_data_version, create_data_version_table, normalize_question
+from snapshot import publish_snapshot
+
+FAQ_FIELDS = ('question', 'answer', 'category', 'tags', 'language')
+
+
+def _normalize_text(text) -> str:
+    return " ".join(unicodedata.normalize("NFC", str(text or "")).casefold().split())
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def question_hash(faq: Dict) -> str:
+    """Identity of an FAQ: the normalized question in its language"""
+    return _digest(normalize_question(faq['question']), _normalize_text(faq.get('language')))
+
+
+def content_hash(faq: Dict) -> str:
+    """Changes whenever anything a user would see changes, including case and line breaks"""
+    return _digest(*(unicodedata.normalize("NFC", str(faq.get(field) or "")).strip()
+                     for field in FAQ_FIELDS))
+
+
+def prepare_faq_table(conn: sqlite3.Connection):
+    """
+    Add the hash columns to legal_faqs if missing, collapse duplicates left
+    by earlier non-idempotent loads (keeping the newest copy) and enforce
+    uniqueness on question_hash.
+    """
+    create_data_version_table(conn)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(legal_faqs)")}
+    for column in ('question_hash', 'content_hash'):
+        if column not in columns:
+            conn.execute(f"ALTER TABLE legal_faqs ADD COLUMN {column} TEXT")
+
+    rows = conn.execute(
+        f"SELECT id, {', '.join(FAQ_FIELDS)} FROM legal_faqs WHERE question_hash IS NULL"
+    ).fetchall()
+    if rows:
+        conn.executemany(
+            "UPDATE legal_faqs SET question_hash = ?, content_hash = ? WHERE id = ?",
+            [(question_hash(faq), content_hash(faq), faq['id'])
+             for faq in (dict(zip(('id',) + FAQ_FIELDS, row)) for row in rows)]
+        )
+        removed = conn.execute('''
+        DELETE FROM legal_faqs WHERE id NOT IN (
+            SELECT MAX(id) FROM legal_faqs GROUP BY question_hash
+        )
+        ''').rowcount
+        if removed:
+            bump_data_version(conn)
+            print(f"🧹 Removed {removed} duplicate FAQs")
+
+    conn.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_legal_faqs_question_hash ON legal_faqs (question_hash)"
+    )
+
+
+def _clean(raw: Dict, default_language: str) -> Optional[Dict]:
+    """Normalize one input row to FAQ_FIELDS, or None if it is not a dict or lacks a question or answer"""
+    if not isinstance(raw, dict):
+        return None
+    question = str(raw.get('question') or '').strip()
+    answer = str(raw.get('answer') or '').strip()
+    if not question or not answer:
+        return None
+
+    tags = raw.get('tags') or ''
+    if isinstance(tags, (list, tuple)):
+        tags = ",".join(str(tag).strip() for tag in tags)
+
+    return {
+        'question': question,
+        'answer': answer,
+        'category': str(raw.get('category') or '').strip() or None,
+        'tags': tags,
+        'language': str(raw.get('language') or default_language).strip().lower(),
+    }
+
+
+def read_faqs(path: str) -> Iterator[Optional[Dict]]:
+    """
+    Stream raw FAQ rows from a .jsonl or .csv file. Unusable JSONL lines are
+    reported and yielded as None so the importer counts them as skipped.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if extension == ".csv":
+            yield from csv.DictReader(f)
+        elif extension in (".jsonl", ".ndjson"):
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    print(f"⚠️ {path}:{line_number}: invalid JSON, skipped")
+                    yield None
+                    continue
+                if not isinstance(row, dict):
+                    print(f"⚠️ {path}:{line_number}: not a JSON object, skipped")
+                    row = None
+                yield row
+        else:
+            raise ValueError(f"Unsupported FAQ file type: {path} (expected .jsonl or .csv)")
+
+
+class FAQImporter:
+    """Idempotent, batched upsert of FAQs keyed on a normalized question hash"""
+
+    def __init__(self, db_path: str = "landgpt.db", batch_size: int = 500,
+                 default_language: str = "hindi"):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.default_language = default_language
+
+    def import_faqs(self, faqs: Iterable[Dict]) -> Dict[str, int]:
+        """Upsert FAQs in batched transactions; returns added/updated/unchanged/duplicates/skipped counts"""
+        counts = {'added': 0, 'updated': 0, 'unchanged': 0, 'duplicates': 0, 'skipped': 0}
+        conn = sqlite3.connect(self.db_path)
+
+        try:
+            prepare_faq_table(conn)
+            conn.commit()
+
+            rows = iter(faqs)
+            while True:
+                batch = list(islice(rows, self.batch_size))
+                if not batch:
+                    break
+                self._import_batch(conn, batch, counts)
+                conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+        return counts
+
+    def import_file(self, path: str) -> Dict[str, int]:
+        return self.import_faqs(read_faqs(path))
+
+    def _import_batch(self, conn: sqlite3.Connection, batch: List[Dict], counts: Dict[str, int]):
+        # Last occurrence of a question within the batch wins
+        pending: Dict[str, Dict] = {}
+        for raw in batch:
+            faq = _clean(raw, self.default_language)
+            if faq is None:
+                counts['skipped'] += 1
+                continue
+            key = question_hash(faq)
+            if key in pending:
+                counts['duplicates'] += 1
+            faq['question_hash'] = key
+            faq['content_hash'] = content_hash(faq)
+            pending[key] = faq
+
+        if not pending:
+            return
+
+        keys = list(pending)
+        existing = dict(conn.execute(
+            f"SELECT question_hash, content_hash FROM legal_faqs "
+            f"WHERE question_hash IN ({', '.join('?' * len(keys))})", keys
+        ).fetchall())
+
+        changed = []
+        for key, faq in pending.items():
+            if key not in existing:
+                counts['added'] += 1
+                changed.append(faq)
+            elif existing[key] != faq['content_hash']:
+                counts['updated'] += 1
+                changed.append(faq)
+            else:
+                counts['unchanged'] += 1
+
+        if not changed:
+            return
+
+        # Updates keep the row's id and created_at
+        columns = FAQ_FIELDS + ('question_hash', 'content_hash')
+        conn.executemany(f'''
+        INSERT INTO legal_faqs ({', '.join(columns)})
+        VALUES ({', '.join('?' * len(columns))})
+        ON CONFLICT (question_hash) DO UPDATE SET
+            question = excluded.question,
+            answer = excluded.answer,
+            category = excluded.category,
+            tags = excluded.tags,
+            language = excluded.language,
+            content_hash = excluded.content_hash
+        ''', [tuple(faq.get(column) for column in columns) for faq in changed])
+        bump_data_version(conn)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python faq_import.py faqs.jsonl [more.csv ...]")
+        sys.exit(1)
+
+    importer = FAQImporter()
+    changed = 0
+    for path in sys.argv[1:]:
+        counts = importer.import_file(path)
+        changed += counts['added'] + counts['updated']
+        print(f"📚 {path}: {counts['added']} added, {counts['updated']} updated, "
+              f"{counts['unchanged']} unchanged, {counts['duplicates']} duplicates, "
+              f"{counts['skipped']} skipped")
+
+    # Query processes read from the snapshot, so publish one for the new FAQs
+    if changed:
+        publish_snapshot(importer.db_path)
@@ -0,0 +1,96 @@
+# LandGPT Phase 1: Holdings index
+# File: holdings.py
+
+import re
+import sqlite3
+import unicodedata
+from typing import Iterable, Optional, Tuple
+
+# Honorifics that vary between entries for the same person
+_HONORIFICS = {"shri", "sri", "smt", "km", "late", "श्री", "श्रीमती", "कु", "स्व"}
+_PUNCTUATION = re.compile(r"[.,;:()\[\]'\"\-/]+")
+
+
+def normalize_owner(name: Optional[str]) -> Optional[str]:
+    """Key used to group one owner's parcels despite spelling and spacing noise"""
+    if not name:
+        return None
+    text = unicodedata.normalize("NFC", str(name)).casefold()
+    text = _PUNCTUATION.sub(" ", text)
+    words = [word for word in text.split() if word not in _HONORIFICS]
+    return " ".join(words) or None
+
+
+def holdings_tables_exist(cursor: sqlite3.Cursor) -> bool:
+    return cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'khata_holdings'"
+    ).fetchone() is not None
+
+
+def create_holdings_tables(cursor: sqlite3.Cursor):
+    """Per-khata and per-owner aggregates, keyed for single-row lookups"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS khata_holdings (
+        district_id INTEGER NOT NULL,
+        khata_number TEXT NOT NULL,
+        parcel_count INTEGER NOT NULL,
+        total_area_hectare REAL,
+        PRIMARY KEY (district_id, khata_number)
+    ) WITHOUT ROWID
+    ''')
+    # Khata lookups without a district
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_khata_holdings_khata ON khata_holdings (khata_number)"
+    )
+
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS owner_holdings (
+        owner_key TEXT NOT NULL,
+        district_id INTEGER NOT NULL,
+        parcel_count INTEGER NOT NULL,
+        total_area_hectare REAL,
+        PRIMARY KEY (owner_key, district_id)
+    ) WITHOUT ROWID
+    ''')
+
+
+def rebuild_holdings(conn: sqlite3.Connection):
+    """Recompute every aggregate from land_records"""
+    conn.execute("DELETE FROM khata_holdings")
+    conn.execute("DELETE FROM owner_holdings")
+    conn.execute('''
+    INSERT INTO khata_holdings
+    SELECT district_id, khata_number, COUNT(*), SUM(normalized_area_hectare)
+    FROM land_records WHERE khata_number IS NOT NULL
+    GROUP BY district_id, khata_number
+    ''')
+    conn.execute('''
+    INSERT INTO owner_holdings
+    SELECT owner_key, district_id, COUNT(*), SUM(normalized_area_hectare)
+    FROM land_records WHERE owner_key IS NOT NULL
+    GROUP BY owner_key, district_id
+    ''')
+
+
+def refresh_holdings(conn: sqlite3.Connection,
+                     khata_keys: Iterable[Tuple[int, str]],
+                     owner_keys: Iterable[Tuple[str, int]]):
+    """Recompute the aggregates for the given (district_id, khata) and (owner_key, district_id) keys"""
+    khata_keys = {key for key in khata_keys if key[0] is not None and key[1] is not None}
+    owner_keys = {key for key in owner_keys if key[0] is not None and key[1] is not None}
+
+    conn.executemany("DELETE FROM khata_holdings WHERE district_id = ? AND khata_number = ?", khata_keys)
+    conn.executemany('''
+    INSERT INTO khata_holdings
+    SELECT district_id, khata_number, COUNT(*), SUM(normalized_area_hectare)
+    FROM land_records WHERE district_id = ? AND khata_number = ?
+    GROUP BY district_id, khata_number
+    ''', khata_keys)
+
+    conn.executemany("DELETE FROM owner_holdings WHERE owner_key = ? AND district_id = ?", owner_keys)
+    conn.executemany('''
+    INSERT INTO owner_holdings
+    SELECT owner_key, district_id, COUNT(*), SUM(normalized_area_hectare)
+    FROM land_records WHERE owner_key = ? AND district_id = ?
+    GROUP BY owner_key, district_id
+    ''', owner_keys)
@@ -0,0 +1,179 @@
+# LandGPT Phase 1: Scraping pipeline
+# File: khatauni_pipeline.py
+
+import importlib.util
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait, ALL_COMPLETED, FIRST_COMPLETED
+from html import escape
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml is several times faster than the stdlib parser on khatauni tables;
+# fall back to html.parser when it is not installed.
+PARSER_BACKEND = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# Row labels used on the khatauni page, mapped to land_records columns
+KHATAUNI_FIELDS = {
+    "जनपद": "district",
+    "तहसील": "tehsil",
+    "ग्राम": "village",
+    "खसरा संख्या": "khasra_number",
+    "खाता संख्या": "khata_number",
+    "खातेदार का नाम": "owner_name",
+    "पिता का नाम": "father_name",
+    "क्षेत्रफल (हेक्टेयर)": "area_hectare",
+    "क्षेत्रफल (बीघा)": "area_bigha",
+    "भूमि का प्रकार": "land_type",
+    "सिंचाई की स्थिति": "irrigation_status",
+    "फसल": "crop_details",
+    "नामांतरण तिथि": "mutation_date",
+    "रजिस्ट्री तिथि": "registry_date",
+}
+
+NUMERIC_FIELDS = ("area_hectare", "area_bigha")
+
+# Only build a tree for the khatauni table, not the page chrome around it
+KHATAUNI_STRAINER = SoupStrainer("table", id="khatauni")
+
+Target = Tuple[str, str, str, str, str]  # district, tehsil, village, search_type, search_value
+
+
+def _cell(value) -> str:
+    return "" if value is None else escape(str(value))
+
+
+def render_khatauni_html(record: Dict) -> str:
+    """Render a record as a khatauni page (used by the mock fetcher and fixtures)"""
+    rows = "\n".join(
+        f'    <tr><td class="label">{label}</td><td class="value">{_cell(record.get(field))}</td></tr>'
+        for label, field in KHATAUNI_FIELDS.items()
+    )
+    return f'''<html>
+<head><meta charset="utf-8"><title>खतौनी - भूलेख उत्तर प्रदेश</title></head>
+<body>
+  <table id="khatauni">
+{rows}
+  </table>
+</body>
+</html>
+'''
+
+
+def parse_khatauni_html(html: str, parser: str = PARSER_BACKEND) -> Optional[Dict]:
+    """Parse a khatauni page into a land record dict, or None if no table is found"""
+    soup = BeautifulSoup(html, parser, parse_only=KHATAUNI_STRAINER)
+    table = soup.find("table", id="khatauni")
+    if table is None:
+        return None
+
+    record = {}
+    for row in table.find_all("tr"):
+        cells = row.find_all("td")
+        if len(cells) < 2:
+            continue
+        field = KHATAUNI_FIELDS.get(cells[0].get_text(strip=True))
+        if field is None:
+            continue
+        value = cells[1].get_text(strip=True) or None
+        if value is not None and field in NUMERIC_FIELDS:
+            try:
+                value = float(value)
+            except ValueError:
+                value = None
+        record[field] = value
+
+    return record
+
+
+def parse_khatauni_batch(pages: List[str], parser: str = PARSER_BACKEND) -> List[Dict]:
+    """Parse a batch of pages; runs inside a worker process"""
+    records = []
+    for html in pages:
+        record = parse_khatauni_html(html, parser)
+        if record:
+            records.append(record)
+    return records
+
+
+class KhatauniPipeline:
+    """Two-stage scraper: threaded fetchers feed raw HTML to a process pool of parsers"""
+
+    _DONE = object()
+
+    def __init__(self, scraper, db, fetch_workers: int = 4, parse_workers: Optional[int] = None,
+                 batch_size: int = 25, queue_size: int = 200):
+        self.scraper = scraper
+        self.db = db
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        # Bounded so fetchers block when the parsers fall behind
+        self.pages: queue.Queue = queue.Queue(maxsize=queue_size)
+
+    def _fetch_worker(self, targets: "queue.Queue[Target]"):
+        while True:
+            try:
+                target = targets.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self.pages.put(self.scraper.fetch_khatauni_html(*target))
+            except Exception as e:
+                print(f"  ❌ Error fetching {'/'.join(target[:3])} khasra {target[4]}: {e}")
+        self.pages.put(self._DONE)
+
+    def run(self, targets: Iterable[Target]) -> int:
+        """Fetch, parse and store all targets; returns the number of records inserted"""
+        target_queue: "queue.Queue[Target]" = queue.Queue()
+        for target in targets:
+            target_queue.put(target)
+
+        fetchers = [
+            threading.Thread(target=self._fetch_worker, args=(target_queue,), daemon=True)
+            for _ in range(self.fetch_workers)
+        ]
+        for fetcher in fetchers:
+            fetcher.start()
+
+        total_inserted = 0
+        with ProcessPoolExecutor(max_workers=self.parse_workers) as pool:
+            # Cap in-flight batches so a slow parser pool stops us draining the queue
+            max_pending = self.parse_workers * 2
+            pending = set()
+            batch: List[str] = []
+            running = len(fetchers)
+
+            def drain(return_when):
+                nonlocal pending, total_inserted
+                done, pending = wait(pending, return_when=return_when)
+                for future in done:
+                    # A bad batch is reported and skipped; the rest of the scrape carries on
+                    try:
+                        records = future.result()
+                    except Exception as e:
+                        print(f"  ❌ Error parsing batch: {e}")
+                        continue
+                    total_inserted += self.db.insert_land_records(records)
+
+            while running:
+                page = self.pages.get()
+                if page is self._DONE:
+                    running -= 1
+                else:
+                    batch.append(page)
+
+                if len(batch) >= self.batch_size or (not running and batch):
+                    if len(pending) >= max_pending:
+                        drain(FIRST_COMPLETED)
+                    pending.add(pool.submit(parse_khatauni_batch, batch))
+                    batch = []
+
+            drain(ALL_COMPLETED)
+
+        for fetcher in fetchers:
+            fetcher.join()
+
+        return total_inserted
@@ -0,0 +1,255 @@
+# LandGPT Phase 1: Structured land record queries
+# File: query_builder.py
+
+import sqlite3
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from dictionary_encoding import CATEGORICAL_COLUMNS, CategoryDictionary
+from date_parsing import to_day_number
+
+# Free-form portal dates and the integer day-number columns parsed from them
+DATE_COLUMNS = {
+    'mutation_date': 'mutation_day',
+    'registry_date': 'registry_day',
+}
+
+TEXT_COLUMNS = (
+    'khasra_number', 'khata_number', 'owner_name', 'father_name',
+    'mutation_date', 'registry_date', 'owner_key', 'created_at'
+)
+
+NUMERIC_COLUMNS = (
+    'id', 'area_hectare', 'area_bigha', 'normalized_area_hectare', 'mutation_day', 'registry_day'
+)
+
+# Every column a query may filter, project or order on
+QUERY_COLUMNS = CATEGORICAL_COLUMNS + TEXT_COLUMNS + NUMERIC_COLUMNS
+
+# Largest code point, used as the exclusive upper bound of a prefix range
+_PREFIX_END = "\U0010ffff"
+
+
+def _physical(column: str) -> str:
+    """Stored column name for a logical one"""
+    return f"{column}_id" if column in CATEGORICAL_COLUMNS else column
+
+
+def _bucket(n: int) -> int:
+    """Round an IN-list length up to a power of two so list sizes share statements"""
+    size = 1
+    while size < n:
+        size *= 2
+    return size
+
+
+@lru_cache(maxsize=256)
+def _statement_for_shape(shape: Tuple) -> str:
+    """SQL text for a query shape; identical shapes give identical text for SQLite's cache"""
+    projection, filters, group, order, has_limit = shape
+
+    sql = f"SELECT {', '.join(projection)} FROM land_records"
+    clauses = []
+    for op, column, arity in filters:
+        if op == 'eq':
+            clauses.append(f"{column} = ?")
+        elif op == 'in':
+            clauses.append(f"{column} IN ({', '.join('?' * arity)})")
+        elif op == 'prefix':
+            clauses.append(f"{column} >= ? AND {column} < ?")
+        elif op == 'contains':
+            clauses.append(f"{column} LIKE ?")
+        elif op == 'min':
+            clauses.append(f"{column} >= ?")
+        elif op == 'max':
+            clauses.append(f"{column} <= ?")
+        elif op == 'not_null':
+            clauses.append(f"{column} IS NOT NULL")
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+
+    if group:
+        sql += f" GROUP BY {group}"
+    if order:
+        sql += " ORDER BY " + ", ".join(
+            f"{column} DESC" if descending else column for column, descending in order
+        )
+    if has_limit:
+        sql += " LIMIT ?"
+    return sql
+
+
+class NoMatch(Exception):
+    """Raised while compiling when a filter can never match (e.g. an unknown district)"""
+
+
+class LandRecordQuery:
+    """
+    Validated query over land_records.
+    Column names are checked against QUERY_COLUMNS and never taken from user
+    input verbatim; values always travel as bound parameters.
+    """
+
+    def __init__(self, *columns: str):
+        self._projection: Tuple[str, ...] = ()
+        self._filters: List[Tuple[str, str, tuple]] = []
+        self._order: List[Tuple[str, bool]] = []
+        self._limit: Optional[int] = None
+        if columns:
+            self.select(*columns)
+
+    @staticmethod
+    def _check(column: str) -> str:
+        if column not in QUERY_COLUMNS:
+            raise ValueError(f"Unknown land_records column: {column!r}")
+        return column
+
+    def select(self, *columns: str) -> "LandRecordQuery":
+        """Restrict the returned columns (all columns by default)"""
+        self._projection = tuple(self._check(column) for column in columns)
+        return self
+
+    def where(self, column: str, value) -> "LandRecordQuery":
+        """Exact match"""
+        self._filters.append(('eq', self._check(column), (value,)))
+        return self
+
+    def where_in(self, column: str, values: Sequence) -> "LandRecordQuery":
+        """Match any of several values"""
+        self._filters.append(('in', self._check(column), tuple(values)))
+        return self
+
+    def prefix(self, column: str, value: str) -> "LandRecordQuery":
+        """Values starting with `value` (case-sensitive, index-friendly)"""
+        if column in NUMERIC_COLUMNS:
+            raise ValueError(f"prefix() needs a text column, got {column!r}")
+        self._filters.append(('prefix', self._check(column), (str(value),)))
+        return self
+
+    def contains(self, column: str, value: str) -> "LandRecordQuery":
+        """Substring match (LIKE '%value%'); cannot use an index on plain columns"""
+        self._filters.append(('contains', self._check(column), (str(value),)))
+        return self
+
+    def between(self, column: str, low=None, high=None) -> "LandRecordQuery":
+        """
+        Inclusive range; mutation_date/registry_date ranges use the parsed day
+        columns. A date bound that cannot be parsed raises ValueError.
+        """
+        self._check(column)
+        if column in DATE_COLUMNS:
+            bounds = []
+            for bound in (low, high):
+                day = to_day_number(bound)
+                if bound is not None and day is None:
+                    raise ValueError(f"Unparseable {column} bound: {bound!r}")
+                bounds.append(day)
+            column = DATE_COLUMNS[column]
+            low, high = bounds
+        elif column not in NUMERIC_COLUMNS:
+            raise ValueError(f"between() needs a numeric or date column, got {column!r}")
+        if low is not None:
+            self._filters.append(('min', column, (low,)))
+        if high is not None:
+            self._filters.append(('max', column, (high,)))
+        return self
+
+    def not_null(self, column: str) -> "LandRecordQuery":
+        self._filters.append(('not_null', _physical(self._check(column)), ()))
+        return self
+
+    def order_by(self, column: str, descending: bool = False) -> "LandRecordQuery":
+        """Sort on a plain column; dictionary-encoded columns sort by their id"""
+        if column in DATE_COLUMNS:
+            column = DATE_COLUMNS[column]
+        self._order.append((_physical(self._check(column)), descending))
+        return self
+
+    def limit(self, n: Optional[int]) -> "LandRecordQuery":
+        self._limit = int(n) if n else None
+        return self
+
+    def _resolve_categorical(self, op: str, column: str, values: tuple,
+                             categories: CategoryDictionary, conn: sqlite3.Connection) -> List[int]:
+        """Turn a filter on a decoded value into matching lookup ids"""
+        if op == 'eq':
+            ids = [categories.id_for(conn, column, values[0])]
+        elif op == 'in':
+            ids = [categories.id_for(conn, column, value) for value in values]
+        elif op == 'prefix':
+            ids = categories.prefix_ids(conn, column, values[0])
+        elif op == 'contains':
+            ids = categories.matching_ids(conn, column, values[0])
+        else:
+            raise ValueError(f"{op} is not supported on dictionary-encoded column {column!r}")
+        return [id_ for id_ in ids if id_ is not None]
+
+    def compile(self, categories: CategoryDictionary, conn: sqlite3.Connection) -> Tuple[str, list]:
+        """SQL text and parameters; raises NoMatch when the result is certainly empty"""
+        projection = tuple(_physical(column) for column in self._projection) or ('*',)
+        return self._compile(categories, conn, projection, None, tuple(self._order), self._limit)
+
+    def _compile(self, categories: CategoryDictionary, conn: sqlite3.Connection, projection: Tuple[str, ...],
+                 group: Optional[str], order: Tuple, limit: Optional[int]) -> Tuple[str, list]:
+        shape_filters = []
+        params: list = []
+
+        for op, column, values in self._filters:
+            if column in CATEGORICAL_COLUMNS:
+                ids = self._resolve_categorical(op, column, values, categories, conn)
+                if not ids:
+                    raise NoMatch(column)
+                op, column, values = 'in', _physical(column), tuple(ids)
+
+            if op == 'in':
+                if not values:
+                    raise NoMatch(column)
+                arity = _bucket(len(values))
+                params.extend(values + (values[-1],) * (arity - len(values)))
+                shape_filters.append((op, column, arity))
+            elif op == 'prefix':
+                params.extend([values[0], values[0] + _PREFIX_END])
+                shape_filters.append((op, column, 2))
+            elif op == 'contains':
+                params.append(f"%{values[0]}%")
+                shape_filters.append((op, column, 1))
+            else:
+                params.extend(values)
+                shape_filters.append((op, column, len(values)))
+
+        if limit:
+            params.append(limit)
+
+        shape = (projection, tuple(shape_filters), group, order, bool(limit))
+        return _statement_for_shape(shape), params
+
+    def execute(self, categories: CategoryDictionary, conn: sqlite3.Connection) -> List[Dict]:
+        """Run the query and return decoded rows"""
+        try:
+            sql, params = self.compile(categories, conn)
+        except NoMatch:
+            return []
+        cursor = conn.execute(sql, params)
+        columns = [desc[0] for desc in cursor.description]
+        return [categories.decode_row(dict(zip(columns, row)), conn) for row in cursor.fetchall()]
+
+    def count(self, categories: CategoryDictionary, conn: sqlite3.Connection, by: Optional[str] = None):
+        """
+        Number of matching rows, or {value: count} grouped on a column when `by`
+        is given; ordering, projection and limit are ignored
+        """
+        group = _physical(self._check(by)) if by else None
+        projection = (group, 'COUNT(*)') if group else ('COUNT(*)',)
+        try:
+            sql, params = self._compile(categories, conn, projection, group, (), None)
+        except NoMatch:
+            return {} if by else 0
+
+        if not by:
+            return conn.execute(sql, params).fetchone()[0]
+        counts = {}
+        for value, count in conn.execute(sql, params):
+            if by in CATEGORICAL_COLUMNS:
+                value = categories.decode(by, value, conn)
+            counts[value] = count
+        return counts
@@ -0,0 +1,101 @@
+# LandGPT Phase 1: Question answering
+# File: responder.py
+
+import json
+import sqlite3
+from typing import Callable, Dict, List, Optional
+
+from answer_cache import AnswerCache, data_version, normalize_question, search_key
+from database_setup import LandRecordDB
+from dictionary_encoding import CategoryDictionary
+
+
+class LandGPTResponder:
+    """Keyword-based answers to user questions, served through an AnswerCache"""
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection], log_db_path: str = "landgpt.db",
+                 cache: Optional[AnswerCache] = None):
+        # connect() returns the connection to read from for the current request
+        self.connect = connect
+        self.log_db_path = log_db_path
+        self.cache = cache or AnswerCache()
+        self.categories = CategoryDictionary()
+
+    def log(self, query: str, response: Optional[str], query_type: str):
+        """Record a question in user_queries (always on the writable database)"""
+        conn = sqlite3.connect(self.log_db_path)
+        try:
+            conn.execute(
+                "INSERT INTO user_queries (query, response, query_type) VALUES (?, ?, ?)",
+                (query, response, query_type)
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not log query: {e}")
+        finally:
+            conn.close()
+
+    def answer(self, question: str, conn: Optional[sqlite3.Connection] = None, log: bool = True) -> str:
+        """Answer a question, from cache when the data has not changed since it was computed"""
+        conn = conn or self.connect()
+        key = normalize_question(question)
+        version = data_version(conn)
+
+        response = self.cache.get(key, version)
+        if response is None:
+            response = self._compute_answer(conn, key)
+            self.cache.put(key, version, response)
+
+        if log:
+            self.log(question, response, "interactive")
+        return response
+
+    def search(self, conn: Optional[sqlite3.Connection] = None, log: bool = True, **params) -> List[Dict]:
+        """search_land_records through the cache; params are logged so the warmer can replay them"""
+        conn = conn or self.connect()
+        key = search_key(params)
+        version = data_version(conn)
+
+        results = self.cache.get(key, version)
+        if results is None:
+            results = LandRecordDB.build_search_query(**params).execute(self.categories, conn)
+            self.cache.put(key, version, results)
+
+        if log:
+            self.log(json.dumps(params, ensure_ascii=False, sort_keys=True), None, "search")
+        return results
+
+    def _compute_answer(self, conn: sqlite3.Connection, question: str) -> str:
+        """Simple keyword-based responses"""
+        if any(word in question for word in ['agra', 'आगरा']):
+            count, avg_area = conn.execute(
+                "SELECT COUNT(*), AVG(area_hectare) FROM land_records_view WHERE district LIKE '%Agra%'"
+            ).fetchone()
+            if count:
+                return f"आगरा में {count} भूमि रिकॉर्ड हैं, औसत क्षेत्रफल {avg_area or 0:.2f} हेक्टेयर"
+            return "आगरा के लिए कोई रिकॉर्ड नहीं मिला"
+
+        if any(word in question for word in ['mutation', 'म्यूटेशन']):
+            row = conn.execute(
+                "SELECT answer FROM legal_faqs WHERE tags LIKE '%mutation%' LIMIT 1"
+            ).fetchone()
+            if row:
+                return row[0]
+            return "म्यूटेशन की जानकारी: यह भूमि स्वामित्व बदलने की प्रक्रिया है"
+
+        if any(word in question for word in ['khasra', 'खसरा']):
+            return "खसरा नंबर: भूमि के टुकड़े की विशिष्ट पहचान संख्या है। यह सरकारी रिकॉर्ड में जमीन की पहचान के लिए उपयोग होती है।"
+
+        if any(word in question for word in ['registry', 'रजिस्ट्री']):
+            return "रजिस्ट्री के लिए आवश्यक दस्तावेज: बिक्री पत्र, पुराना रजिस्ट्री दस्तावेज, खसरा/खतौनी, आधार कार्ड, PAN कार्ड"
+
+        if any(word in question for word in ['help', 'मदद']):
+            return "\n".join([
+                "मैं निम्न विषयों में मदद कर सकता हूं:",
+                "   • भूमि रिकॉर्ड खोजना",
+                "   • म्यूटेशन प्रक्रिया",
+                "   • रजिस्ट्री की जानकारी",
+                "   • खसरा नंबर की व्याख्या",
+            ])
+
+        return "मैं आपकी भूमि संबंधी समस्या में मदद करने की कोशिश कर रहा हूं। कृपया अधिक स्पष्ट प्रश्न पूछें।"
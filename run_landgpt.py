@@ -8,7 +8,7 @@ def install_requirements():
     """Install required packages"""
     print("📦 Installing required packages...")
     packages = [
-        "requests", "beautifulsoup4", "pandas", "numpy",
+        "requests", "beautifulsoup4", "lxml", "pandas", "numpy",
         "selenium", "webdriver-manager", "loguru", "fake-useragent"
     ]
 
@@ -64,12 +64,34 @@ def run_demo():
 def interactive_query():
     """Simple interactive query system"""
     import sqlite3
-    import pandas as pd
+    from snapshot import SnapshotReader
+    from answer_cache import CacheWarmer
+    from responder import LandGPTResponder
 
     print("\n💬 LandGPT Interactive Query System")
     print("Enter 'quit' to exit")
 
-    conn = sqlite3.connect("landgpt.db")
+    # Prefer the published read-only snapshot so queries never contend with scrape writes
+    if SnapshotReader.available():
+        reader = SnapshotReader()
+        connect = reader.connection
+        # The warmer runs in its own thread with its own reader
+        warmer_reader = SnapshotReader()
+        warmer_connect = warmer_reader.connection
+    else:
+        reader = None
+        conn = sqlite3.connect("landgpt.db")
+        connect = lambda: conn
+        # One connection for the warmer, used first here and then by its thread
+        warmer_conn = sqlite3.connect("landgpt.db", check_same_thread=False)
+        warmer_connect = lambda: warmer_conn
+
+    responder = LandGPTResponder(connect)
+
+    # Precompute answers to the most frequent logged questions so the first
+    # users after a restart do not pay cold-cache latency
+    warmer = CacheWarmer(responder, warmer_connect)
+    warmer.start()
 
     while True:
         user_input = input("\n🗣️ Ask about land records: ").strip()
@@ -77,46 +99,16 @@ def interactive_query():
         if user_input.lower() in ['quit', 'exit', 'q']:
             break
 
-        # Simple keyword-based responses
-        if any(word in user_input.lower() for word in ['agra', 'आगरा']):
-            df = pd.read_sql_query(
-                "SELECT COUNT(*) as count, AVG(area_hectare) as avg_area FROM land_records WHERE district LIKE '%Agra%'",
-                conn
-            )
-            if not df.empty and df.iloc[0]['count'] > 0:
-                count = df.iloc[0]['count']
-                avg_area = df.iloc[0]['avg_area'] or 0
-                print(f"🤖 आगरा में {count} भूमि रिकॉर्ड हैं, औसत क्षेत्रफल {avg_area:.2f} हेक्टेयर")
-            else:
-                print("🤖 आगरा के लिए कोई रिकॉर्ड नहीं मिला")
-
-        elif any(word in user_input.lower() for word in ['mutation', 'म्यूटेशन']):
-            df = pd.read_sql_query(
-                "SELECT answer FROM legal_faqs WHERE tags LIKE '%mutation%' LIMIT 1",
-                conn
-            )
-            if not df.empty:
-                print(f"🤖 {df.iloc[0]['answer']}")
-            else:
-                print("🤖 म्यूटेशन की जानकारी: यह भूमि स्वामित्व बदलने की प्रक्रिया है")
-
-        elif any(word in user_input.lower() for word in ['khasra', 'खसरा']):
-            print("🤖 खसरा नंबर: भूमि के टुकड़े की विशिष्ट पहचान संख्या है। यह सरकारी रिकॉर्ड में जमीन की पहचान के लिए उपयोग होती है।")
+        # connect() picks up a newly published snapshot between questions
+        print(f"🤖 {responder.answer(user_input)}")
 
-        elif any(word in user_input.lower() for word in ['registry', 'रजिस्ट्री']):
-            print("🤖 रजिस्ट्री के लिए आवश्यक दस्तावेज: बिक्री पत्र, पुराना रजिस्ट्री दस्तावेज, खसरा/खतौनी, आधार कार्ड, PAN कार्ड")
-
-        elif any(word in user_input.lower() for word in ['help', 'मदद']):
-            print("🤖 मैं निम्न विषयों में मदद कर सकता हूं:")
-            print("   • भूमि रिकॉर्ड खोजना")
-            print("   • म्यूटेशन प्रक्रिया")
-            print("   • रजिस्ट्री की जानकारी")
-            print("   • खसरा नंबर की व्याख्या")
-
-        else:
-            print("🤖 मैं आपकी भूमि संबंधी समस्या में मदद करने की कोशिश कर रहा हूं। कृपया अधिक स्पष्ट प्रश्न पूछें।")
-
-    conn.close()
+    warmer.stop()
+    if reader:
+        reader.close()
+        warmer_reader.close()
+    else:
+        conn.close()
+        warmer_conn.close()
     print("👋 धन्यवाद!")
 
 def main_menu():
@@ -189,7 +181,7 @@ def show_database_stats():
     cursor.execute("SELECT COUNT(*) FROM legal_faqs")
     faq_count = cursor.fetchone()[0]
 
-    cursor.execute("SELECT COUNT(DISTINCT district) FROM land_records")
+    cursor.execute("SELECT COUNT(DISTINCT district_id) FROM land_records")
     district_count = cursor.fetchone()[0]
 
     print(f"📄 Land Records: {land_count}")
@@ -199,7 +191,7 @@ def show_database_stats():
     # Show sample records
     if land_count > 0:
         print(f"\n📝 Sample Records:")
-        df = pd.read_sql_query("SELECT district, village, owner_name, khasra_number FROM land_records LIMIT 3", conn)
+        df = pd.read_sql_query("SELECT district, village, owner_name, khasra_number FROM land_records_view LIMIT 3", conn)
         for _, row in df.iterrows():
             print(f"   • {row['district']} - {row['village']} - Khasra {row['khasra_number']}")
 
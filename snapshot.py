@@ -0,0 +1,143 @@
+# LandGPT Phase 1: Read snapshots
+# File: snapshot.py
+
+import os
+import sqlite3
+import time
+from urllib.parse import quote
+from typing import Dict, List, Optional
+
+SNAPSHOT_DIR = "snapshots"
+CURRENT_POINTER = "CURRENT"
+DEFAULT_MMAP_SIZE = 1 << 30  # 1 GiB; SQLite maps at most the file size
+
+
+def publish_snapshot(db_path: str = "landgpt.db", snapshot_dir: str = SNAPSHOT_DIR,
+                     keep: int = 3) -> str:
+    """
+    Write a compacted, analyzed, read-only copy of the database and make it current.
+    Readers pick the new snapshot up on their next refresh(); the previous
+    snapshots are kept so in-flight readers are never pulled from under them.
+    """
+    os.makedirs(snapshot_dir, exist_ok=True)
+
+    # UTC so names keep sorting by age across DST changes; pruning relies on it
+    now_ns = time.time_ns()
+    stamp = time.strftime('%Y%m%d-%H%M%S', time.gmtime(now_ns // 1_000_000_000))
+    name = f"landgpt-{stamp}-{now_ns % 1_000_000_000:09d}.db"
+    final_path = os.path.join(snapshot_dir, name)
+    tmp_path = final_path + ".tmp"
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("VACUUM INTO ?", (tmp_path,))
+    finally:
+        conn.close()
+
+    snap = sqlite3.connect(tmp_path)
+    try:
+        snap.execute("ANALYZE")
+        snap.commit()
+    finally:
+        snap.close()
+
+    os.replace(tmp_path, final_path)
+    os.chmod(final_path, 0o444)
+
+    # Swap the pointer atomically so readers never see a half-written name
+    pointer_path = os.path.join(snapshot_dir, CURRENT_POINTER)
+    pointer_tmp = pointer_path + ".tmp"
+    with open(pointer_tmp, "w") as f:
+        f.write(name)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(pointer_tmp, pointer_path)
+
+    _prune_snapshots(snapshot_dir, keep, current=name)
+    print(f"📸 Published snapshot {final_path}")
+    return final_path
+
+
+def _prune_snapshots(snapshot_dir: str, keep: int, current: Optional[str] = None):
+    """Remove all but the newest `keep` snapshots, never the current one"""
+    if keep <= 0:
+        return
+    snapshots = sorted(
+        name for name in os.listdir(snapshot_dir)
+        if name.startswith("landgpt-") and name.endswith(".db") and name != current
+    )
+    if current is not None:
+        keep -= 1
+    for name in snapshots[:max(len(snapshots) - keep, 0)]:
+        try:
+            os.remove(os.path.join(snapshot_dir, name))
+        except OSError:
+            # Still open by a reader on a platform that forbids unlinking it
+            pass
+
+
+class SnapshotReader:
+    """Read-only connection to the current snapshot that can hot-swap between requests"""
+
+    def __init__(self, snapshot_dir: str = SNAPSHOT_DIR, mmap_size: int = DEFAULT_MMAP_SIZE):
+        self.snapshot_dir = snapshot_dir
+        self.mmap_size = mmap_size
+        self.pointer_path = os.path.join(snapshot_dir, CURRENT_POINTER)
+        self.snapshot_path: Optional[str] = None
+        self._pointer_mtime: Optional[int] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def available(snapshot_dir: str = SNAPSHOT_DIR) -> bool:
+        """Whether a snapshot has been published"""
+        return os.path.exists(os.path.join(snapshot_dir, CURRENT_POINTER))
+
+    def _open(self, path: str) -> sqlite3.Connection:
+        uri = f"file:{quote(os.path.abspath(path))}?mode=ro&immutable=1"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        return conn
+
+    def refresh(self) -> bool:
+        """Switch to the newest snapshot if one was published; returns True on a swap"""
+        try:
+            mtime = os.stat(self.pointer_path).st_mtime_ns
+        except FileNotFoundError:
+            if self._conn is None:
+                raise
+            return False
+
+        if self._conn is not None and mtime == self._pointer_mtime:
+            return False
+
+        with open(self.pointer_path) as f:
+            path = os.path.join(self.snapshot_dir, f.read().strip())
+
+        if path == self.snapshot_path and self._conn is not None:
+            self._pointer_mtime = mtime
+            return False
+
+        new_conn = self._open(path)
+        old_conn = self._conn
+        self._conn, self.snapshot_path, self._pointer_mtime = new_conn, path, mtime
+        if old_conn is not None:
+            old_conn.close()
+        return True
+
+    def connection(self) -> sqlite3.Connection:
+        """Connection for the next request, refreshed to the current snapshot"""
+        self.refresh()
+        return self._conn
+
+    def query(self, sql: str, params=()) -> List[Dict]:
+        """Run a read query against the current snapshot"""
+        cursor = self.connection().execute(sql, params)
+        columns = [desc[0] for desc in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self.snapshot_path = None
+            self._pointer_mtime = None
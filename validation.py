@@ -0,0 +1,96 @@
+# LandGPT Phase 1: Record validation
+# File: validation.py
+
+from datetime import date
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from area_units import BIGHA_HECTARE_BY_DISTRICT, DEFAULT_BIGHA_HECTARE, area_array, bigha_to_hectare
+from date_parsing import to_day_number
+
+# Largest single parcel we accept, well above any khasra on UP khataunis;
+# the bigha limit uses the smallest local bigha so it is never the stricter one
+MAX_AREA_HECTARE = 500.0
+MAX_AREA_BIGHA = MAX_AREA_HECTARE / min(min(BIGHA_HECTARE_BY_DISTRICT.values()), DEFAULT_BIGHA_HECTARE)
+
+# Recorded hectares and converted bighas may differ this much (relative) before
+# the pair is considered inconsistent; local bigha sizes vary within districts
+AREA_MISMATCH_TOLERANCE = 0.25
+
+EARLIEST_DATE = date(1900, 1, 1)
+
+REQUIRED_FIELDS = ('district', 'tehsil', 'village', 'khasra_number')
+DATE_FIELDS = ('mutation_date', 'registry_date')
+
+Rejection = Tuple[Dict, List[str]]
+
+
+def _float_column(records: List[Dict], field: str) -> np.ndarray:
+    # Unparseable counts as out of range
+    return area_array([record.get(field) for record in records], invalid=np.inf)
+
+
+def validate_batch(records: List[Dict], today: date = None) -> Tuple[List[Dict], List[Rejection]]:
+    """
+    Check a batch column-wise and split it into accepted records and
+    (record, reasons) rejections. Within a batch the last copy of a
+    khasra wins, matching INSERT OR REPLACE; earlier copies are rejected.
+    """
+    n = len(records)
+    if n == 0:
+        return [], []
+
+    checks: Dict[str, np.ndarray] = {}
+
+    for field in REQUIRED_FIELDS:
+        present = np.array([bool(str(r.get(field) or '').strip()) for r in records])
+        checks[f"missing_{field}"] = ~present
+
+    hectare = _float_column(records, 'area_hectare')
+    bigha = _float_column(records, 'area_bigha')
+    has_hectare = ~np.isnan(hectare)
+    has_bigha = ~np.isnan(bigha)
+
+    with np.errstate(invalid='ignore'):
+        checks["area_hectare_out_of_range"] = has_hectare & ~((hectare > 0) & (hectare <= MAX_AREA_HECTARE))
+        checks["area_bigha_out_of_range"] = has_bigha & ~((bigha > 0) & (bigha <= MAX_AREA_BIGHA))
+
+        factors = np.array([bigha_to_hectare(r.get('district')) for r in records], dtype=float)
+        converted = bigha * factors
+        relative = np.abs(hectare - converted) / np.maximum(hectare, converted)
+        checks["area_hectare_bigha_mismatch"] = (
+            has_hectare & has_bigha & np.isfinite(relative) & (relative > AREA_MISMATCH_TOLERANCE)
+        )
+
+    latest_day = to_day_number(today or date.today())
+    earliest_day = to_day_number(EARLIEST_DATE)
+    for field in DATE_FIELDS:
+        raw = [r.get(field) for r in records]
+        days = np.array([to_day_number(v) for v in raw], dtype=float)  # None -> nan
+        given = np.array([bool(str(v or '').strip()) for v in raw])
+        parsed = ~np.isnan(days)
+        checks[f"unparseable_{field}"] = given & ~parsed
+        with np.errstate(invalid='ignore'):
+            checks[f"future_{field}"] = parsed & (days > latest_day)
+            checks[f"implausible_{field}"] = parsed & (days < earliest_day)
+
+    # Duplicate khasras in the batch: keep the last occurrence of each key
+    keys = np.array([
+        "\x1f".join(str(r.get(field) or '') for field in REQUIRED_FIELDS) for r in records
+    ], dtype=object)
+    _, last_from_end = np.unique(keys[::-1], return_index=True)
+    is_last = np.zeros(n, dtype=bool)
+    is_last[n - 1 - last_from_end] = True
+    checks["duplicate_in_batch"] = ~is_last
+
+    names = list(checks)
+    matrix = np.column_stack([checks[name] for name in names])
+    rejected_rows = matrix.any(axis=1)
+
+    accepted = [records[i] for i in np.flatnonzero(~rejected_rows)]
+    rejected = [
+        (records[i], [names[j] for j in np.flatnonzero(matrix[i])])
+        for i in np.flatnonzero(rejected_rows)
+    ]
+    return accepted, rejected